@@ -3,55 +3,102 @@
 Backend Tracking Query Tool
 Query expiration dates and retention information for record destruction scheduling
 """
+import argparse
 import json
 import os
-import sys
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
+import numpy as np
+import openpyxl
 import pandas as pd
 
+# Above this row count a sheet is streamed through openpyxl's write_only
+# mode, which keeps memory bounded instead of materializing Cell objects
+STREAM_ROW_THRESHOLD = 100_000
+
+# Fast SIMD-based JSON parsing (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Faster streaming Excel writer (optional)
+try:
+    import xlsxwriter  # noqa: F401
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+def _read_json_file(path):
+    """Parse one JSON file with orjson when available"""
+    if ORJSON_AVAILABLE:
+        # orjson parses from bytes, so skip the text-mode decode
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_tracking_registry(folder_path):
-    """Load the backend tracking registry"""
-    registry_file = os.path.join(folder_path, '_backend_tracking_registry.json')
-    
-    if not os.path.exists(registry_file):
-        print(f"❌ No tracking registry found at: {registry_file}")
-        print("Run the document processor first to generate tracking data.")
-        return None
-    
+    """Load the backend tracking registry
+
+    The processor writes a small header (_registry_header.json) plus an
+    append-only JSONL expiration log; older runs produced one combined
+    _backend_tracking_registry.json, which is still readable.
+    """
+    header_file = os.path.join(folder_path, '_registry_header.json')
+    jsonl_file = os.path.join(folder_path, '_expiration_tracking.jsonl')
+    legacy_file = os.path.join(folder_path, '_backend_tracking_registry.json')
+
     try:
-        with open(registry_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        if os.path.exists(header_file):
+            registry = _read_json_file(header_file)
+            entries = []
+            if os.path.exists(jsonl_file):
+                loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+                with open(jsonl_file, 'rb') as f:
+                    entries = [loads(line) for line in f if line.strip()]
+            registry['expiration_tracking'] = entries
+            return registry
+
+        if os.path.exists(legacy_file):
+            return _read_json_file(legacy_file)
     except Exception as e:
         print(f"❌ Error loading registry: {e}")
         return None
 
+    print(f"❌ No tracking registry found in: {folder_path}")
+    print("Run the document processor first to generate tracking data.")
+    return None
+
 def query_expiring_documents(registry, months_ahead=12):
     """Query documents expiring within specified months"""
     if not registry or 'expiration_tracking' not in registry:
         return []
     
-    today = datetime.now()
-    future_date = today + timedelta(days=30 * months_ahead)
-    
-    expiring_docs = []
-    for doc in registry['expiration_tracking']:
-        exp_date_str = doc.get('expiration_date')
-        if exp_date_str:
-            try:
-                exp_date = datetime.fromisoformat(exp_date_str)
-                if today <= exp_date <= future_date:
-                    # Calculate days until expiration
-                    days_until = (exp_date - today).days
-                    doc_copy = doc.copy()
-                    doc_copy['days_until_expiration'] = days_until
-                    expiring_docs.append(doc_copy)
-            except ValueError:
-                continue
-    
-    # Sort by expiration date
-    expiring_docs.sort(key=lambda x: x.get('expiration_date', ''))
-    return expiring_docs
+    df = pd.DataFrame(registry['expiration_tracking'])
+    if df.empty or 'expiration_date' not in df.columns:
+        return []
+
+    # Parse all dates in one vectorized pass; invalid/missing dates become NaT
+    exp = pd.to_datetime(df['expiration_date'], format='ISO8601', errors='coerce')
+
+    # Work on raw int64 nanosecond timestamps - plain integer compares and
+    # divides, no per-row timedelta objects
+    ns_per_day = 86_400_000_000_000
+    exp_ns = exp.to_numpy(dtype='datetime64[ns]').astype('int64')
+    today_ns = np.datetime64('now', 'ns').astype('int64')
+    future_ns = today_ns + 30 * months_ahead * ns_per_day
+
+    mask = exp.notna().to_numpy() & (exp_ns >= today_ns) & (exp_ns <= future_ns)
+
+    # Filter, add the computed column and sort in one chained pass; rows are
+    # only materialized as dicts once, at return time
+    return (df[mask]
+            .assign(days_until_expiration=(exp_ns[mask] - today_ns) // ns_per_day)
+            .sort_values('expiration_date')
+            .to_dict('records'))
 
 def query_by_retention_category(registry, category=None):
     """Query documents by retention category"""
@@ -65,11 +112,78 @@ def query_by_retention_category(registry, category=None):
         # Return all with their categories
         return registry['expiration_tracking']
 
-def generate_excel_report(registry, output_path=None):
-    """Generate Excel report for backend tracking"""
+def _write_report_sheets(writer, df_ordered):
+    """Write the standard report sheets for one DataFrame segment"""
+    # All documents
+    df_ordered.to_excel(writer, sheet_name='All_Documents', index=False)
+
+    # Expiring soon (next 90 days)
+    expiring_soon = df_ordered[df_ordered['expiration_status'] == 'EXPIRING_SOON']
+    if not expiring_soon.empty:
+        expiring_soon.to_excel(writer, sheet_name='Expiring_90_Days', index=False)
+
+    # By retention category - one hash pass instead of a scan per category
+    for category, cat_data in df_ordered.groupby('retention_category',
+                                                 sort=False, dropna=True):
+        sheet_name = f'Category_{category}'.replace('/', '_')[:31]  # Excel limit
+        cat_data.to_excel(writer, sheet_name=sheet_name, index=False)
+
+def _stream_cell(value):
+    """Coerce a pandas cell to a type openpyxl's write_only mode accepts"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    if isinstance(value, (np.generic, pd.Timestamp)):
+        return value.item() if isinstance(value, np.generic) else value.to_pydatetime()
+    return value
+
+def _write_report_streaming(output_path, df_ordered, index_df=None):
+    """Write the report with a write_only workbook (bounded memory)"""
+    sheets = []
+    if index_df is not None:
+        sheets.append(('Segments', index_df))
+    sheets.append(('All_Documents', df_ordered))
+
+    expiring_soon = df_ordered[df_ordered['expiration_status'] == 'EXPIRING_SOON']
+    if not expiring_soon.empty:
+        sheets.append(('Expiring_90_Days', expiring_soon))
+
+    for category, cat_data in df_ordered.groupby('retention_category',
+                                                 sort=False, dropna=True):
+        sheets.append((f'Category_{category}'.replace('/', '_')[:31], cat_data))
+
+    wb = openpyxl.Workbook(write_only=True)
+    try:
+        for sheet_name, frame in sheets:
+            ws = wb.create_sheet(sheet_name)
+            ws.append(list(frame.columns))
+            for row in frame.itertuples(index=False, name=None):
+                ws.append([_stream_cell(value) for value in row])
+        wb.save(output_path)
+    finally:
+        wb.close()
+
+def _write_report_workbook(output_path, df_ordered, index_df=None):
+    """Write one report workbook, streaming when the segment is large"""
+    if len(df_ordered) > STREAM_ROW_THRESHOLD:
+        _write_report_streaming(output_path, df_ordered, index_df)
+        return
+
+    with pd.ExcelWriter(output_path, engine=EXCEL_ENGINE,
+                        datetime_format='yyyy-mm-dd') as writer:
+        if index_df is not None:
+            index_df.to_excel(writer, sheet_name='Segments', index=False)
+        _write_report_sheets(writer, df_ordered)
+
+def generate_excel_report(registry, output_path=None, segment_size=250_000):
+    """Generate Excel report for backend tracking
+
+    Registries larger than segment_size rows are split across several
+    workbooks (..._part1.xlsx, ...) so Excel opens them quickly; the
+    first part carries an index sheet listing all segments.
+    """
     if not registry:
         return None
-    
+
     try:
         # Prepare data for Excel
         all_docs = registry.get('expiration_tracking', [])
@@ -81,19 +195,16 @@ def generate_excel_report(registry, output_path=None):
         # Convert to DataFrame
         df = pd.DataFrame(all_docs)
         
-        # Add helpful columns for backend processing
-        today = datetime.now()
-        df['days_until_expiration'] = df['expiration_date'].apply(
-            lambda x: (datetime.fromisoformat(x) - today).days if x else None
-        )
-        
-        df['expiration_status'] = df['days_until_expiration'].apply(
-            lambda days: 'EXPIRED' if days and days < 0 
-                         else 'EXPIRING_SOON' if days and days <= 90
-                         else 'ACTIVE' if days and days > 90
-                         else 'NO_EXPIRATION'
-        )
-        
+        # Add helpful columns for backend processing, both in one assign
+        exp = pd.to_datetime(df['expiration_date'], format='ISO8601', errors='coerce')
+        days = (exp - pd.Timestamp.now().normalize()).dt.days
+        df = df.assign(
+            days_until_expiration=days,
+            expiration_status=np.select(
+                [days < 0, days <= 90, days > 90],
+                ['EXPIRED', 'EXPIRING_SOON', 'ACTIVE'],
+                default='NO_EXPIRATION'))
+
         # Reorder columns for backend use
         column_order = [
             'tracking_id', 'vendor', 'document_type', 'filename', 
@@ -102,34 +213,46 @@ def generate_excel_report(registry, output_path=None):
             'destruction_review_required', 'file_path', 'processing_date'
         ]
         
-        # Only include columns that exist
+        # Only include columns that exist; computed once, reused by every
+        # sheet and segment below
         available_columns = [col for col in column_order if col in df.columns]
         df_ordered = df[available_columns]
-        
+
+        # Categorical codes make the per-category groupby hash int8 codes
+        # instead of comparing Python strings
+        if 'retention_category' in df_ordered.columns:
+            df_ordered = df_ordered.assign(
+                retention_category=df_ordered['retention_category'].astype('category'))
+
         # Set output path
         if not output_path:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_path = f'backend_tracking_report_{timestamp}.xlsx'
         
-        # Write to Excel
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # All documents
-            df_ordered.to_excel(writer, sheet_name='All_Documents', index=False)
-            
-            # Expiring soon (next 90 days)
-            expiring_soon = df_ordered[df_ordered['expiration_status'] == 'EXPIRING_SOON']
-            if not expiring_soon.empty:
-                expiring_soon.to_excel(writer, sheet_name='Expiring_90_Days', index=False)
-            
-            # By retention category
-            for category in df['retention_category'].unique():
-                if pd.notna(category):
-                    cat_data = df_ordered[df_ordered['retention_category'] == category]
-                    sheet_name = f'Category_{category}'.replace('/', '_')[:31]  # Excel limit
-                    cat_data.to_excel(writer, sheet_name=sheet_name, index=False)
-        
-        print(f"✅ Excel report generated: {output_path}")
-        return output_path
+        # Write to Excel, segmenting oversized registries across workbooks
+        if len(df_ordered) <= segment_size:
+            _write_report_workbook(output_path, df_ordered)
+            print(f"✅ Excel report generated: {output_path}")
+            return output_path
+
+        stem, ext = os.path.splitext(output_path)
+        num_parts = -(-len(df_ordered) // segment_size)  # ceil division
+        part_paths = [f"{stem}_part{i + 1}{ext}" for i in range(num_parts)]
+
+        # Index sheet listing every segment, written into the first part
+        index_df = pd.DataFrame({
+            'segment': [os.path.basename(p) for p in part_paths],
+            'rows': [min(segment_size, len(df_ordered) - n * segment_size)
+                     for n in range(num_parts)]
+        })
+
+        for i, part_path in enumerate(part_paths):
+            chunk = df_ordered.iloc[i * segment_size:(i + 1) * segment_size]
+            _write_report_workbook(part_path, chunk,
+                                   index_df=index_df if i == 0 else None)
+            print(f"✅ Excel report segment generated: {part_path}")
+
+        return part_paths[0]
         
     except Exception as e:
         print(f"❌ Error generating Excel report: {e}")
@@ -155,38 +278,40 @@ def print_summary(registry):
 
 def main():
     """Main function for command-line usage"""
-    if len(sys.argv) < 2:
-        print("Backend Tracking Query Tool")
-        print("Usage: python backend_tracking_query.py <folder_path> [options]")
-        print("\nOptions:")
-        print("  --summary                Show summary information")
-        print("  --expiring <months>      Show documents expiring in N months (default: 12)")
-        print("  --category <name>        Show documents by retention category")
-        print("  --excel [path]          Generate Excel report")
-        print("\nExamples:")
-        print("  python backend_tracking_query.py C:/contracts --summary")
-        print("  python backend_tracking_query.py C:/contracts --expiring 6")
-        print("  python backend_tracking_query.py C:/contracts --excel report.xlsx")
+    parser = argparse.ArgumentParser(
+        description="Backend Tracking Query Tool",
+        epilog="Examples:\n"
+               "  python backend_tracking_query.py C:/contracts --summary\n"
+               "  python backend_tracking_query.py C:/contracts --expiring 6\n"
+               "  python backend_tracking_query.py C:/contracts --excel report.xlsx",
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('folder_path', nargs='?',
+                        help="Folder containing the tracking registry")
+    parser.add_argument('--summary', action='store_true',
+                        help="Show summary information")
+    parser.add_argument('--expiring', type=int, nargs='?', const=12, metavar='MONTHS',
+                        help="Show documents expiring in N months (default: 12)")
+    parser.add_argument('--category', type=str, metavar='NAME',
+                        help="Show documents by retention category")
+    parser.add_argument('--excel', type=str, nargs='?', const='', metavar='PATH',
+                        help="Generate Excel report")
+    args = parser.parse_args()
+
+    if not args.folder_path:
+        parser.print_help()
         return
-    
-    folder_path = sys.argv[1]
-    
+
     # Load tracking registry
-    registry = load_tracking_registry(folder_path)
+    registry = load_tracking_registry(args.folder_path)
     if not registry:
         return
-    
+
     # Process commands
-    if '--summary' in sys.argv:
+    if args.summary:
         print_summary(registry)
-    
-    if '--expiring' in sys.argv:
-        try:
-            idx = sys.argv.index('--expiring')
-            months = int(sys.argv[idx + 1]) if idx + 1 < len(sys.argv) else 12
-        except (ValueError, IndexError):
-            months = 12
-        
+
+    if args.expiring is not None:
+        months = args.expiring
         expiring = query_expiring_documents(registry, months)
         print(f"\n🗓️  DOCUMENTS EXPIRING IN NEXT {months} MONTHS:")
         print("-" * 60)
@@ -203,13 +328,8 @@ def main():
         else:
             print(f"No documents expiring in next {months} months")
     
-    if '--category' in sys.argv:
-        try:
-            idx = sys.argv.index('--category')
-            category = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else None
-        except IndexError:
-            category = None
-        
+    if args.category:
+        category = args.category
         docs = query_by_retention_category(registry, category)
         if category:
             print(f"\n📂 DOCUMENTS IN CATEGORY: {category}")
@@ -224,14 +344,8 @@ def main():
             exp_date = doc.get('expiration_date', 'No expiration')
             print(f"{vendor} - {doc_type} - {ret_cat} - Expires: {exp_date}")
     
-    if '--excel' in sys.argv:
-        try:
-            idx = sys.argv.index('--excel')
-            output_path = sys.argv[idx + 1] if idx + 1 < len(sys.argv) else None
-        except IndexError:
-            output_path = None
-        
-        generate_excel_report(registry, output_path)
+    if args.excel is not None:
+        generate_excel_report(registry, args.excel or None)
 
 if __name__ == "__main__":
     main()
@@ -3,28 +3,255 @@ Unified Document Processing GUI
 Combines all document processing tools in one interface
 """
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox
+import tkinter.font as tkfont
+from itertools import islice
 import threading
+import queue
 import sys
+from collections import deque
+from contextlib import redirect_stdout, redirect_stderr
 import os
 from pathlib import Path
+from datetime import datetime
+import hashlib
 import json
+import pickle
 
 # Import our unified processor
 from document_processor import DocumentProcessor, process_contracts_simple, process_contracts_enhanced, sort_files_by_year
 
+class VirtualLogView(tk.Canvas):
+    """Virtualized log viewer: the widget owns its lines, Tk does not
+
+    Tk Text stores, wraps and lays out every inserted byte, so its cost
+    grows with total log volume. Here the lines live in a bounded deque
+    and only the rows inside the viewport are drawn as canvas text
+    items, making appends O(1) and redraws O(visible rows) no matter
+    how much has been logged.
+    """
+
+    # Because rendering is decoupled from storage, the history can be
+    # much deeper than a Text widget could tolerate
+    HISTORY_LINES = 50000
+
+    def __init__(self, parent, max_lines=HISTORY_LINES, font=None,
+                 fg='#D4D4D4', **kwargs):
+        kwargs.setdefault('highlightthickness', 0)
+        super().__init__(parent, **kwargs)
+        self.lines = deque(maxlen=max_lines)
+        self.font = font
+        self.fg = fg
+        self.row_height = font.metrics('linespace') if font else 16
+        # Index of the first visible line
+        self.top_index = 0
+        self._scrollbar_set = None
+        self.bind('<Configure>', lambda e: self.redraw())
+        self.bind('<MouseWheel>',
+                  lambda e: self.yview_scroll(-e.delta // 120, 'units'))
+        self.bind('<Button-4>', lambda e: self.yview_scroll(-3, 'units'))
+        self.bind('<Button-5>', lambda e: self.yview_scroll(3, 'units'))
+
+    def attach_scrollbar(self, scrollbar):
+        """Wire a ttk.Scrollbar to this viewer in both directions"""
+        self._scrollbar_set = scrollbar.set
+        scrollbar.configure(command=self.yview)
+
+    def _rows_visible(self):
+        return max(1, self.winfo_height() // self.row_height)
+
+    # Scrollbar protocol: mirror the yview interface Tk widgets expose
+    def yview(self, *args):
+        if not args:
+            total = len(self.lines) or 1
+            first = self.top_index / total
+            last = min(1.0, (self.top_index + self._rows_visible()) / total)
+            return (first, last)
+        if args[0] == 'moveto':
+            self.top_index = int(float(args[1]) * len(self.lines))
+        elif args[0] == 'scroll':
+            count = int(args[1])
+            if args[2] == 'pages':
+                count *= self._rows_visible()
+            self.top_index += count
+        self._clamp_top()
+        self.redraw()
+
+    def yview_scroll(self, count, what):
+        self.yview('scroll', count, what)
+
+    def _clamp_top(self):
+        max_top = max(0, len(self.lines) - self._rows_visible())
+        self.top_index = min(max(self.top_index, 0), max_top)
+
+    def append(self, text, follow_tail=True):
+        """Add lines to the buffer; redraw pinned to the tail or in place"""
+        self.lines.extend(text.splitlines())
+        if follow_tail:
+            self.top_index = max(0, len(self.lines) - self._rows_visible())
+        else:
+            self._clamp_top()
+        self.redraw()
+
+    def clear(self):
+        self.lines.clear()
+        self.top_index = 0
+        self.redraw()
+
+    def redraw(self):
+        self.delete('all')
+        y = 2
+        for line in islice(self.lines, self.top_index,
+                           self.top_index + self._rows_visible()):
+            self.create_text(6, y, text=line, font=self.font,
+                             fill=self.fg, anchor='nw')
+            y += self.row_height
+        if self._scrollbar_set is not None:
+            self._scrollbar_set(*self.yview())
+
 class RedirectText:
-    """Redirect stdout/stderr to GUI text widget"""
-    def __init__(self, text_widget):
+    """Redirect stdout/stderr to the GUI log viewer
+
+    Writes land in a thread-safe queue; a self-rescheduling timer on
+    the Tk thread drains it into the viewer in one append per tick.
+    This keeps the worker threads that run DocumentProcessor off Tk
+    entirely (Tk is not thread-safe) and caps widget updates at ~20
+    per second instead of a full insert+scroll+redraw per print call.
+    """
+
+    FLUSH_INTERVAL_MS = 50
+    # Lines kept in the viewer's ring buffer
+    MAX_LOG_LINES = 5000
+    # Bytes handed to the viewer per tick; one oversized append would
+    # block the mainloop, so anything beyond waits for an immediate
+    # re-arm
+    MAX_FLUSH_BYTES = 256 * 1024
+
+    def __init__(self, text_widget, auto_scroll_var=None, log_file=None):
         self.output = text_widget
-    
+        self.auto_scroll_var = auto_scroll_var
+        # Optional authoritative copy on disk: the widget keeps only a
+        # bounded tail, the file keeps everything
+        self.log_file = log_file
+        self.buffer = queue.Queue()
+        # Lines held back while the widget is not viewable (window
+        # minimized); bounded so a long background run can't grow it
+        self._hidden_backlog = deque(maxlen=self.MAX_LOG_LINES)
+        # Incomplete line awaiting its newline (see write); guarded by
+        # a lock because the same writer serves stdout and stderr, and
+        # the pool's result threads interleave their writes
+        self._partial = ''
+        self._write_lock = threading.Lock()
+        self.output.after(self.FLUSH_INTERVAL_MS, self._flush)
+
+    def _should_follow_tail(self):
+        """Follow new output only when enabled and already at the tail
+
+        Scrolling back through the log must stick; yanking the view to
+        the bottom on every flush made scrollback unusable under load.
+        """
+        if self.auto_scroll_var is not None and not self.auto_scroll_var.get():
+            return False
+        return self.output.yview()[1] > 0.98
+
     def write(self, string):
-        self.output.insert(tk.END, string)
-        self.output.see(tk.END)
-        self.output.update()
-    
+        # Called from worker threads; only the queue and the partial
+        # buffer are touched here, never Tk. Line-buffered: print()
+        # hands over content and '\n' in two calls, so partial lines
+        # are held back until their newline arrives, halving queue
+        # traffic
+        with self._write_lock:
+            string = self._partial + string
+            newline_at = string.rfind('\n')
+            if newline_at < 0:
+                self._partial = string
+            else:
+                self._partial = string[newline_at + 1:]
+                complete = string[:newline_at + 1]
+                if self.log_file is not None:
+                    # Buffered write on the producer thread; the OS
+                    # flushes in 8KB blocks, not per line
+                    try:
+                        self.log_file.write(complete)
+                    except (OSError, ValueError):
+                        self.log_file = None
+                self.buffer.put_nowait(complete)
+
+    def _flush(self):
+        if not self.output.winfo_viewable():
+            # Window minimized or tab hidden: nothing to paint, so keep
+            # Tk untouched and just bank the tail of the output
+            try:
+                while True:
+                    self._hidden_backlog.extend(
+                        self.buffer.get_nowait().splitlines(keepends=True))
+            except queue.Empty:
+                pass
+            self.output.after(self.FLUSH_INTERVAL_MS, self._flush)
+            return
+        chunks = []
+        pending = 0
+        if self._hidden_backlog:
+            chunks.extend(self._hidden_backlog)
+            self._hidden_backlog.clear()
+        try:
+            while pending < self.MAX_FLUSH_BYTES:
+                chunk = self.buffer.get_nowait()
+                chunks.append(chunk)
+                pending += len(chunk)
+        except queue.Empty:
+            pass
+        if chunks:
+            # Trimming is inherent: the viewer's deque drops lines past
+            # MAX_LOG_LINES on append, and the redraw only touches the
+            # visible viewport
+            self.output.append(''.join(chunks),
+                               follow_tail=self._should_follow_tail())
+            # No update()/update_idletasks() here: the mainloop paints
+            # on its own once this callback returns, and a forced event
+            # pump per flush re-enters Tk with O(pending events) cost
+        # If output was left behind by the byte cap, continue as soon as
+        # the mainloop has painted rather than waiting a full interval
+        delay = 0 if not self.buffer.empty() else self.FLUSH_INTERVAL_MS
+        self.output.after(delay, self._flush)
+
     def flush(self):
-        pass
+        # Release any held partial line (e.g. a progress prompt printed
+        # without a trailing newline, or end-of-run teardown)
+        with self._write_lock:
+            if self._partial:
+                self.buffer.put_nowait(self._partial)
+                self._partial = ''
+
+def _vendor_column(df):
+    """Pick the vendor column from a dataframe, defaulting to the first"""
+    for col in ['vendor', 'vendors', 'company', 'name']:
+        if col in df.columns:
+            return df[col].dropna().tolist()
+    return df.iloc[:, 0].dropna().tolist()
+
+def _load_txt_vendors(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+def _load_csv_vendors(file_path):
+    import pandas as pd
+    return _vendor_column(pd.read_csv(file_path))
+
+def _load_xlsx_vendors(file_path):
+    import pandas as pd
+    return _vendor_column(pd.read_excel(file_path))
+
+# Dispatch on extension with one dict lookup; adding a format means
+# adding a loader here, not another endswith branch
+_VENDOR_LOADERS = {
+    '.txt': _load_txt_vendors,
+    '.csv': _load_csv_vendors,
+    '.xlsx': _load_xlsx_vendors,
+}
+# txt lists skip the pickle cache - reading lines is cheaper than the
+# round trip
+_CACHED_VENDOR_EXTS = frozenset(['.csv', '.xlsx'])
 
 class DocumentProcessorApp:
     """Main application class for document processing"""
@@ -69,20 +296,41 @@ class DocumentProcessorApp:
         # Configure modern style
         self.setup_styles()
         
-        # Configuration storage
-        self.config_file = Path.home() / "Documents" / "DocumentProcessorLogs" / "config.json"
+        # Configuration storage; log_dir is derived once - Path.home()
+        # stats the environment on every call, and several builders and
+        # handlers need the same directory
+        self.log_dir = Path.home() / "Documents" / "DocumentProcessorLogs"
+        self.config_file = self.log_dir / "config.json"
         self.config = self.load_config()
+        self._config_dirty = False
         
         # Create the main interface
         self.create_header()
         self.create_notebook()
         self.create_log_area()
         
-        # Redirect stdout to log area
-        self.original_stdout = sys.stdout
-        self.original_stderr = sys.stderr
-        sys.stdout = RedirectText(self.log_text)
-        sys.stderr = RedirectText(self.log_text)
+        # Full session log on disk: the viewer keeps a bounded tail in
+        # memory, the file keeps everything for post-run inspection
+        try:
+            self.log_dir.mkdir(parents=True, exist_ok=True)
+            session_name = f"session_{datetime.now():%Y%m%d_%H%M%S}.log"
+            self._session_log = open(self.log_dir / session_name, 'a',
+                                     buffering=8192, encoding='utf-8')
+        except OSError:
+            self._session_log = None
+
+        # Log writer for the processing runs; stdout/stderr are only
+        # redirected around those calls, not for the whole process, so
+        # unrelated library chatter still reaches the real terminal
+        self.log_writer = RedirectText(self.log_text, self.auto_scroll_var,
+                                       log_file=self._session_log)
+
+        # One long-lived worker consumes queued jobs serially, so two
+        # Start clicks can never run concurrently (interleaving their
+        # moves and log output) and runs don't pay thread startup
+        self._jobs = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
     
     def load_config(self):
         """Load saved configuration"""
@@ -95,17 +343,59 @@ class DocumentProcessorApp:
         return {}
     
     def save_config(self):
-        """Save current configuration"""
+        """Mark the configuration dirty and schedule a coalesced write.
+
+        Rapid setting changes (e.g. toggling checkboxes before a run)
+        collapse into a single disk write ~500ms after the last change.
+        """
+        if not self._config_dirty:
+            self._config_dirty = True
+            self.root.after(500, self._flush_config)
+
+    def _flush_config(self):
+        """Hand a dirty configuration to a background writer thread
+
+        The mkdir/open/rename sequence can stall on slow or network
+        home directories, so the Tk thread only snapshots the dict;
+        the disk I/O happens off-loop.
+        """
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        threading.Thread(target=self._write_config,
+                         args=(dict(self.config),), daemon=True).start()
+
+    def _write_config(self, snapshot):
+        """Write a config snapshot to disk atomically."""
         try:
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write to a temp file then rename so a crash mid-write
+            # never leaves a truncated config.json behind.
+            tmp_file = self.config_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(snapshot, f, indent=2)
+            os.replace(tmp_file, self.config_file)
         except Exception:
             pass
     
     def setup_styles(self):
         """Configure modern ttk styles"""
         style = ttk.Style()
+
+        # Shared Font objects: Tk builds (and caches metrics for) one
+        # font per instance, so widgets reuse these instead of parsing
+        # a tuple literal and allocating a font apiece
+        self.font_title = tkfont.Font(family='Segoe UI', size=20, weight='bold')
+        self.font_section = tkfont.Font(family='Segoe UI', size=16, weight='bold')
+        self.font_subtitle = tkfont.Font(family='Segoe UI', size=11)
+        self.font_subtitle_bold = tkfont.Font(family='Segoe UI', size=11, weight='bold')
+        self.font_body = tkfont.Font(family='Segoe UI', size=10)
+        self.font_body_bold = tkfont.Font(family='Segoe UI', size=10, weight='bold')
+        self.font_small = tkfont.Font(family='Segoe UI', size=9)
+        self.font_label = tkfont.Font(family='Arial', size=9)
+        self.font_label_bold = tkfont.Font(family='Arial', size=9, weight='bold')
+        self.font_button = tkfont.Font(family='Arial', size=10, weight='bold')
+        self.font_mono = tkfont.Font(family='Cascadia Code', size=9)
         
         # Configure notebook style
         style.configure('Modern.TNotebook', 
@@ -113,7 +403,7 @@ class DocumentProcessorApp:
                        borderwidth=0)
         style.configure('Modern.TNotebook.Tab',
                        padding=[20, 12],
-                       font=('Segoe UI', 10),
+                       font=self.font_body,
                        focuscolor='none')
         
         # Configure frame styles
@@ -131,118 +421,114 @@ class DocumentProcessorApp:
         style.configure('Modern.TLabelframe.Label',
                        background=self.colors['card'],
                        foreground=self.colors['text_primary'],
-                       font=('Segoe UI', 10, 'bold'))
+                       font=self.font_body_bold)
         
         # Configure button styles
         style.configure('Primary.TButton',
-                       font=('Segoe UI', 10),
+                       font=self.font_body,
                        padding=[20, 10])
         style.configure('Secondary.TButton',
-                       font=('Segoe UI', 10),
+                       font=self.font_body,
                        padding=[15, 8])
         style.configure('Accent.TButton',
-                       font=('Segoe UI', 10, 'bold'),
+                       font=self.font_body_bold,
                        padding=[25, 12])
         
         # Configure entry styles
         style.configure('Modern.TEntry',
                        padding=[8, 6],
-                       font=('Segoe UI', 9))
-    
+                       font=self.font_small)
+
+        # Option tables for create_modern_button - one dict lookup and
+        # a ** unpack per button instead of a per-call if/elif chain
+        self._btn_styles = {
+            'primary': dict(
+                bg=self.colors['primary'], fg='white',
+                font=self.font_body_bold, pady=12, padx=20,
+                relief='flat', cursor='hand2',
+                activebackground=self.colors['secondary'],
+                activeforeground='white'),
+            'accent': dict(
+                bg=self.colors['accent'], fg='white',
+                font=self.font_body_bold, pady=12, padx=25,
+                relief='flat', cursor='hand2',
+                activebackground='#059669',
+                activeforeground='white'),
+            'danger': dict(
+                bg=self.colors['danger'], fg='white',
+                font=self.font_body_bold, pady=12, padx=20,
+                relief='flat', cursor='hand2',
+                activebackground='#DC2626',
+                activeforeground='white'),
+            'secondary': dict(
+                bg=self.colors['card'], fg=self.colors['text_primary'],
+                font=self.font_body, pady=10, padx=15,
+                relief='solid', bd=1, cursor='hand2',
+                activebackground=self.colors['hover'],
+                activeforeground=self.colors['text_primary']),
+        }
+
     def create_modern_button(self, parent, text, command, style='primary', width=None):
         """Create a modern styled button"""
-        if style == 'primary':
-            btn = tk.Button(parent, text=text, command=command,
-                           bg=self.colors['primary'], fg='white',
-                           font=('Segoe UI', 10, 'bold'),
-                           pady=12, padx=20,
-                           relief='flat', cursor='hand2',
-                           activebackground=self.colors['secondary'],
-                           activeforeground='white')
-        elif style == 'accent':
-            btn = tk.Button(parent, text=text, command=command,
-                           bg=self.colors['accent'], fg='white',
-                           font=('Segoe UI', 10, 'bold'),
-                           pady=12, padx=25,
-                           relief='flat', cursor='hand2',
-                           activebackground='#059669',
-                           activeforeground='white')
-        elif style == 'danger':
-            btn = tk.Button(parent, text=text, command=command,
-                           bg=self.colors['danger'], fg='white',
-                           font=('Segoe UI', 10, 'bold'),
-                           pady=12, padx=20,
-                           relief='flat', cursor='hand2',
-                           activebackground='#DC2626',
-                           activeforeground='white')
-        else:  # secondary
-            btn = tk.Button(parent, text=text, command=command,
-                           bg=self.colors['card'], fg=self.colors['text_primary'],
-                           font=('Segoe UI', 10),
-                           pady=10, padx=15,
-                           relief='solid', bd=1, cursor='hand2',
-                           activebackground=self.colors['hover'],
-                           activeforeground=self.colors['text_primary'])
-        
+        options = self._btn_styles.get(style, self._btn_styles['secondary'])
+        btn = tk.Button(parent, text=text, command=command, **options)
+
         if width:
             btn.configure(width=width)
-        
+
         return btn
     
     def create_header(self):
-        """Create modern application header"""
-        # Main header container
-        header_frame = tk.Frame(self.root, bg=self.colors['primary'], height=80)
-        header_frame.pack(fill='x')
-        header_frame.pack_propagate(False)
-        
-        # Inner container for content alignment
-        header_content = tk.Frame(header_frame, bg=self.colors['primary'])
-        header_content.pack(fill='both', expand=True, padx=30)
-        
-        # Left side - title and subtitle
-        title_frame = tk.Frame(header_content, bg=self.colors['primary'])
-        title_frame.pack(side='left', fill='y')
-        
-        title_label = tk.Label(
-            title_frame, 
-            text="Document Processing Suite", 
-            font=("Segoe UI", 20, "bold"), 
-            fg="white", 
-            bg=self.colors['primary']
+        """Create modern application header
+
+        The header is static chrome, so it is drawn as text items on a
+        single Canvas instead of a tree of Frame/Label widgets - one Tk
+        window and one geometry pass instead of seven.
+        """
+        header = tk.Canvas(
+            self.root,
+            height=80,
+            bg=self.colors['primary'],
+            highlightthickness=0
         )
-        title_label.pack(anchor='w', pady=(12, 2))
-        
-        subtitle_label = tk.Label(
-            title_frame,
+        header.pack(fill='x')
+
+        header.create_text(
+            30, 28,
+            text="Document Processing Suite",
+            font=self.font_title,
+            fill="white",
+            anchor='w'
+        )
+        header.create_text(
+            30, 58,
             text="Intelligent contract organization with signature detection & expiration tracking",
-            font=("Segoe UI", 9),
-            fg="#A5B4FC",  # Light blue
-            bg=self.colors['primary']
+            font=self.font_small,
+            fill="#A5B4FC",  # Light blue
+            anchor='w'
         )
-        subtitle_label.pack(anchor='w')
-        
-        # Right side - version and status
-        status_frame = tk.Frame(header_content, bg=self.colors['primary'])
-        status_frame.pack(side='right', fill='y')
-        
-        version_label = tk.Label(
-            status_frame,
+
+        # Right side - version and status, re-anchored on resize
+        version_id = header.create_text(
+            0, 28,
             text="v2.0",
-            font=("Segoe UI", 10, "bold"),
-            fg="#A5B4FC",
-            bg=self.colors['primary']
+            font=self.font_body_bold,
+            fill="#A5B4FC",
+            anchor='e'
         )
-        version_label.pack(anchor='e', pady=(15, 2))
-        
-        status_label = tk.Label(
-            status_frame,
+        status_id = header.create_text(
+            0, 52,
             text="Ready",
-            font=("Segoe UI", 9),
-            fg="#34D399",  # Green
-            bg=self.colors['primary']
+            font=self.font_small,
+            fill="#34D399",  # Green
+            anchor='e'
         )
-        status_label.pack(anchor='e')
+
+        def _align_right(event):
+            header.coords(version_id, event.width - 30, 28)
+            header.coords(status_id, event.width - 30, 52)
+
+        header.bind('<Configure>', _align_right)
     
     def create_notebook(self):
         """Create modern tabbed interface"""
@@ -253,29 +539,66 @@ class DocumentProcessorApp:
         # Create notebook with modern style
         self.notebook = ttk.Notebook(notebook_container, style='Modern.TNotebook')
         self.notebook.pack(fill='both', expand=True)
-        
-        # Create tabs with icons and improved styling
-        self.create_contract_renamer_tab()
-        self.create_file_sorter_tab()
-        self.create_settings_tab()
+
+        # Tabs register empty frames up front but only build their
+        # widgets on first visit, so startup pays for one tab's widget
+        # tree instead of all three
+        self._tab_builders = {}
+        self._built_tabs = set()
+        for title, builder in (
+                ("📋 Contract Processor", self.create_contract_renamer_tab),
+                ("🗂️ Date Sorter", self.create_file_sorter_tab),
+                ("⚙️ Settings", self.create_settings_tab)):
+            tab_frame = ttk.Frame(self.notebook, style='Card.TFrame')
+            self.notebook.add(tab_frame, text=title)
+            self._tab_builders[str(tab_frame)] = (builder, tab_frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        self._build_current_tab()
+
+    def _on_tab_changed(self, event=None):
+        self._build_current_tab()
+
+    def _build_current_tab(self):
+        """Build the selected tab's widgets the first time it shows"""
+        tab_id = self.notebook.select()
+        if tab_id and tab_id not in self._built_tabs:
+            self._built_tabs.add(tab_id)
+            builder, tab_frame = self._tab_builders[tab_id]
+            builder(tab_frame)
     
-    def create_contract_renamer_tab(self):
+    def create_contract_renamer_tab(self, frame):
         """Create modern contract renaming tab"""
-        frame = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(frame, text="📋 Contract Processor")
         
         # Main container with modern scrolling
         canvas = tk.Canvas(frame, bg=self.colors['background'], highlightthickness=0)
         scrollbar = ttk.Scrollbar(frame, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg=self.colors['background'])
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
+        # Resize drags fire <Configure> once per pixel of movement, and
+        # bbox("all") walks every canvas item; debounce so only one
+        # scrollregion recomputation runs per 50ms idle window
+        sr_after = [None]
+
+        def _update_scrollregion():
+            sr_after[0] = None
+            canvas.configure(scrollregion=canvas.bbox("all"))
+
+        def _on_frame_configure(event):
+            if sr_after[0] is not None:
+                canvas.after_cancel(sr_after[0])
+            sr_after[0] = canvas.after(50, _update_scrollregion)
+
+        scrollable_frame.bind("<Configure>", _on_frame_configure)
+
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Wheel scrolling over the tab body (Windows/mac deltas and
+        # X11 button events)
+        canvas.bind('<MouseWheel>',
+                    lambda e: canvas.yview_scroll(-e.delta // 120, 'units'))
+        canvas.bind('<Button-4>', lambda e: canvas.yview_scroll(-1, 'units'))
+        canvas.bind('<Button-5>', lambda e: canvas.yview_scroll(1, 'units'))
         
         # Hero section with description
         hero_frame = tk.Frame(scrollable_frame, bg=self.colors['card'], relief='flat', bd=1)
@@ -288,7 +611,7 @@ class DocumentProcessorApp:
         title_label = tk.Label(
             title_frame,
             text="🔄 Intelligent Contract Processing",
-            font=("Segoe UI", 16, "bold"),
+            font=self.font_section,
             fg=self.colors['text_primary'],
             bg=self.colors['card']
         )
@@ -297,7 +620,7 @@ class DocumentProcessorApp:
         desc_label = tk.Label(
             hero_frame, 
             text="Transform your contract chaos into organized, searchable documents with signature detection, expiration tracking, and smart classification.",
-            font=("Segoe UI", 11), 
+            font=self.font_subtitle, 
             fg=self.colors['text_secondary'],
             bg=self.colors['card'],
             wraplength=900,
@@ -306,14 +629,14 @@ class DocumentProcessorApp:
         desc_label.pack(padx=25, pady=(0, 20), anchor='w')
         
         # Input folder selection
-        input_frame = tk.LabelFrame(scrollable_frame, text="Source Directory", font=("Arial", 10, "bold"))
+        input_frame = tk.LabelFrame(scrollable_frame, text="Source Directory", font=self.font_button)
         input_frame.pack(fill='x', padx=20, pady=5)
         
         self.input_var = tk.StringVar(value=self.config.get('input_folder', ''))
         input_entry_frame = tk.Frame(input_frame)
         input_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        input_entry = tk.Entry(input_entry_frame, textvariable=self.input_var, font=("Arial", 9))
+        input_entry = tk.Entry(input_entry_frame, textvariable=self.input_var, font=self.font_label)
         input_entry.pack(side='left', fill='x', expand=True)
         
         input_browse_btn = tk.Button(
@@ -322,19 +645,19 @@ class DocumentProcessorApp:
             command=lambda: self.browse_folder(self.input_var),
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         input_browse_btn.pack(side='right', padx=(5, 0))
         
         # Error folder selection
-        error_frame = tk.LabelFrame(scrollable_frame, text="Error Files Directory", font=("Arial", 10, "bold"))
+        error_frame = tk.LabelFrame(scrollable_frame, text="Error Files Directory", font=self.font_button)
         error_frame.pack(fill='x', padx=20, pady=5)
         
         self.error_var = tk.StringVar(value=self.config.get('error_folder', ''))
         error_entry_frame = tk.Frame(error_frame)
         error_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        error_entry = tk.Entry(error_entry_frame, textvariable=self.error_var, font=("Arial", 9))
+        error_entry = tk.Entry(error_entry_frame, textvariable=self.error_var, font=self.font_label)
         error_entry.pack(side='left', fill='x', expand=True)
         
         error_browse_btn = tk.Button(
@@ -343,19 +666,19 @@ class DocumentProcessorApp:
             command=lambda: self.browse_folder(self.error_var),
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         error_browse_btn.pack(side='right', padx=(5, 0))
         
         # Vendor master list (optional)
-        vendor_frame = tk.LabelFrame(scrollable_frame, text="Vendor Master List (Optional)", font=("Arial", 10, "bold"))
+        vendor_frame = tk.LabelFrame(scrollable_frame, text="Vendor Master List (Optional)", font=self.font_button)
         vendor_frame.pack(fill='x', padx=20, pady=5)
         
         self.vendor_file_var = tk.StringVar(value=self.config.get('vendor_file', ''))
         vendor_entry_frame = tk.Frame(vendor_frame)
         vendor_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        vendor_entry = tk.Entry(vendor_entry_frame, textvariable=self.vendor_file_var, font=("Arial", 9))
+        vendor_entry = tk.Entry(vendor_entry_frame, textvariable=self.vendor_file_var, font=self.font_label)
         vendor_entry.pack(side='left', fill='x', expand=True)
         
         vendor_browse_btn = tk.Button(
@@ -364,12 +687,12 @@ class DocumentProcessorApp:
             command=self.browse_vendor_file,
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         vendor_browse_btn.pack(side='right', padx=(5, 0))
         
         # Processing options
-        options_frame = tk.LabelFrame(scrollable_frame, text="Processing Options", font=("Arial", 10, "bold"))
+        options_frame = tk.LabelFrame(scrollable_frame, text="Processing Options", font=self.font_button)
         options_frame.pack(fill='x', padx=20, pady=5)
         
         options_inner = tk.Frame(options_frame)
@@ -379,7 +702,7 @@ class DocumentProcessorApp:
         mode_frame = tk.Frame(options_inner)
         mode_frame.pack(fill='x', pady=5)
         
-        tk.Label(mode_frame, text="Processing Mode:", font=("Arial", 9, "bold")).pack(side='left')
+        tk.Label(mode_frame, text="Processing Mode:", font=self.font_label_bold).pack(side='left')
         
         self.processing_mode = tk.StringVar(value=self.config.get('processing_mode', 'enhanced'))
         
@@ -388,7 +711,7 @@ class DocumentProcessorApp:
             text="Simple (YYYYMMDD_Vendor_File)", 
             variable=self.processing_mode, 
             value='simple',
-            font=("Arial", 9)
+            font=self.font_label
         )
         simple_radio.pack(side='left', padx=(10, 0))
         
@@ -397,7 +720,7 @@ class DocumentProcessorApp:
             text="Enhanced (K_Vendor_type_001)", 
             variable=self.processing_mode, 
             value='enhanced',
-            font=("Arial", 9)
+            font=self.font_label
         )
         enhanced_radio.pack(side='left', padx=(10, 0))
         
@@ -409,7 +732,7 @@ class DocumentProcessorApp:
             options_inner, 
             text="Create organized subfolders (_final for signed documents, _supporting for all others)", 
             variable=self.create_subfolders_var,
-            font=("Arial", 9)
+            font=self.font_label
         )
         subfolder_check.pack(anchor='w', pady=2)
         
@@ -417,7 +740,7 @@ class DocumentProcessorApp:
             options_inner, 
             text="Include files in subfolders", 
             variable=self.include_subfolders_var,
-            font=("Arial", 9)
+            font=self.font_label
         )
         include_check.pack(anchor='w', pady=2)
         
@@ -434,7 +757,7 @@ class DocumentProcessorApp:
             "• OCR support for scanned documents"
         )
         
-        info_frame = tk.LabelFrame(scrollable_frame, text="Features", font=("Arial", 10, "bold"))
+        info_frame = tk.LabelFrame(scrollable_frame, text="Features", font=self.font_button)
         info_frame.pack(fill='x', padx=20, pady=5)
         
         info_label = tk.Label(
@@ -442,7 +765,7 @@ class DocumentProcessorApp:
             text=info_text, 
             justify="left", 
             fg="darkblue", 
-            font=("Arial", 9),
+            font=self.font_label,
             wraplength=750
         )
         info_label.pack(padx=10, pady=10)
@@ -466,7 +789,7 @@ class DocumentProcessorApp:
         progress_label = tk.Label(
             self.progress_frame,
             text="Processing documents...",
-            font=("Segoe UI", 10),
+            font=self.font_body,
             fg=self.colors['text_secondary'],
             bg=self.colors['background']
         )
@@ -476,7 +799,7 @@ class DocumentProcessorApp:
         note_label = tk.Label(
             action_frame,
             text="💡 Processing may take a few minutes depending on document count and complexity",
-            font=("Segoe UI", 9),
+            font=self.font_small,
             fg=self.colors['text_secondary'],
             bg=self.colors['background']
         )
@@ -485,10 +808,8 @@ class DocumentProcessorApp:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
-    def create_file_sorter_tab(self):
+    def create_file_sorter_tab(self, frame):
         """Create modern file sorting tab"""
-        frame = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(frame, text="🗂️ Date Sorter")
         
         # Modern container for file sorter
         container = tk.Frame(frame, bg=self.colors['background'])
@@ -501,7 +822,7 @@ class DocumentProcessorApp:
         title_label = tk.Label(
             hero_frame,
             text="🗓️ Smart Date-Based File Organization",
-            font=("Segoe UI", 16, "bold"),
+            font=self.font_section,
             fg=self.colors['text_primary'],
             bg=self.colors['card']
         )
@@ -510,7 +831,7 @@ class DocumentProcessorApp:
         desc_label = tk.Label(
             hero_frame, 
             text="Archive older documents while preserving your folder structure. Perfect for compliance and storage management.",
-            font=("Segoe UI", 11), 
+            font=self.font_subtitle, 
             fg=self.colors['text_secondary'],
             bg=self.colors['card'],
             wraplength=900,
@@ -519,14 +840,14 @@ class DocumentProcessorApp:
         desc_label.pack(padx=25, pady=(0, 20), anchor='w')
         
         # Source directory
-        source_frame = tk.LabelFrame(container, text="Source Directory (to clean)", font=("Arial", 10, "bold"))
+        source_frame = tk.LabelFrame(container, text="Source Directory (to clean)", font=self.font_button)
         source_frame.pack(fill='x', padx=20, pady=10)
         
         self.sort_source_var = tk.StringVar(value=self.config.get('sort_source', ''))
         source_entry_frame = tk.Frame(source_frame)
         source_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        source_entry = tk.Entry(source_entry_frame, textvariable=self.sort_source_var, font=("Arial", 9))
+        source_entry = tk.Entry(source_entry_frame, textvariable=self.sort_source_var, font=self.font_label)
         source_entry.pack(side='left', fill='x', expand=True)
         
         source_browse_btn = tk.Button(
@@ -535,19 +856,19 @@ class DocumentProcessorApp:
             command=lambda: self.browse_folder(self.sort_source_var),
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         source_browse_btn.pack(side='right', padx=(5, 0))
         
         # Pre-2017 archive directory
-        archive_frame = tk.LabelFrame(container, text="Pre-2017 Archive Directory", font=("Arial", 10, "bold"))
+        archive_frame = tk.LabelFrame(container, text="Pre-2017 Archive Directory", font=self.font_button)
         archive_frame.pack(fill='x', padx=20, pady=10)
         
         self.archive_var = tk.StringVar(value=self.config.get('archive_folder', ''))
         archive_entry_frame = tk.Frame(archive_frame)
         archive_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        archive_entry = tk.Entry(archive_entry_frame, textvariable=self.archive_var, font=("Arial", 9))
+        archive_entry = tk.Entry(archive_entry_frame, textvariable=self.archive_var, font=self.font_label)
         archive_entry.pack(side='left', fill='x', expand=True)
         
         archive_browse_btn = tk.Button(
@@ -556,19 +877,19 @@ class DocumentProcessorApp:
             command=lambda: self.browse_folder(self.archive_var),
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         archive_browse_btn.pack(side='right', padx=(5, 0))
         
         # Error directory
-        sort_error_frame = tk.LabelFrame(container, text="Error Files Directory", font=("Arial", 10, "bold"))
+        sort_error_frame = tk.LabelFrame(container, text="Error Files Directory", font=self.font_button)
         sort_error_frame.pack(fill='x', padx=20, pady=10)
         
         self.sort_error_var = tk.StringVar(value=self.config.get('sort_error_folder', ''))
         sort_error_entry_frame = tk.Frame(sort_error_frame)
         sort_error_entry_frame.pack(fill='x', padx=10, pady=10)
         
-        sort_error_entry = tk.Entry(sort_error_entry_frame, textvariable=self.sort_error_var, font=("Arial", 9))
+        sort_error_entry = tk.Entry(sort_error_entry_frame, textvariable=self.sort_error_var, font=self.font_label)
         sort_error_entry.pack(side='left', fill='x', expand=True)
         
         sort_error_browse_btn = tk.Button(
@@ -577,21 +898,21 @@ class DocumentProcessorApp:
             command=lambda: self.browse_folder(self.sort_error_var),
             bg="#4CAF50", 
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         sort_error_browse_btn.pack(side='right', padx=(5, 0))
         
         # Year threshold
-        threshold_frame = tk.LabelFrame(container, text="Options", font=("Arial", 10, "bold"))
+        threshold_frame = tk.LabelFrame(container, text="Options", font=self.font_button)
         threshold_frame.pack(fill='x', padx=20, pady=10)
         
         threshold_inner = tk.Frame(threshold_frame)
         threshold_inner.pack(fill='x', padx=10, pady=10)
         
-        tk.Label(threshold_inner, text="Remove files older than year:", font=("Arial", 9)).pack(side='left')
+        tk.Label(threshold_inner, text="Remove files older than year:", font=self.font_label).pack(side='left')
         
         self.year_threshold = tk.StringVar(value=self.config.get('year_threshold', '2017'))
-        year_entry = tk.Entry(threshold_inner, textvariable=self.year_threshold, width=8, font=("Arial", 9))
+        year_entry = tk.Entry(threshold_inner, textvariable=self.year_threshold, width=8, font=self.font_label)
         year_entry.pack(side='left', padx=(10, 0))
         
         # Information section
@@ -604,7 +925,7 @@ class DocumentProcessorApp:
             "• Move problematic files to error folder for review"
         )
         
-        info_frame = tk.LabelFrame(container, text="Information", font=("Arial", 10, "bold"))
+        info_frame = tk.LabelFrame(container, text="Information", font=self.font_button)
         info_frame.pack(fill='x', padx=20, pady=10)
         
         info_label = tk.Label(
@@ -612,7 +933,7 @@ class DocumentProcessorApp:
             text=info_text, 
             justify="left", 
             fg="darkblue", 
-            font=("Arial", 9),
+            font=self.font_label,
             wraplength=750
         )
         info_label.pack(padx=10, pady=10)
@@ -634,19 +955,17 @@ class DocumentProcessorApp:
         warning_label = tk.Label(
             action_frame,
             text="⚠️ This operation will move files. Ensure you have backups before proceeding.",
-            font=("Segoe UI", 9),
+            font=self.font_small,
             fg=self.colors['danger'],
             bg=self.colors['background']
         )
         warning_label.pack(pady=(5, 0))
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, frame):
         """Create modern settings and configuration tab"""
-        frame = ttk.Frame(self.notebook, style='Card.TFrame')
-        self.notebook.add(frame, text="⚙️ Settings")
         
         # OCR Settings
-        ocr_frame = tk.LabelFrame(frame, text="OCR Configuration", font=("Arial", 10, "bold"))
+        ocr_frame = tk.LabelFrame(frame, text="OCR Configuration", font=self.font_button)
         ocr_frame.pack(fill='x', padx=20, pady=10)
         
         # Check OCR availability
@@ -661,7 +980,7 @@ class DocumentProcessorApp:
         ocr_status_label = tk.Label(
             ocr_frame, 
             text=f"OCR Status: {ocr_status}", 
-            font=("Arial", 10, "bold"),
+            font=self.font_button,
             fg=ocr_color
         )
         ocr_status_label.pack(pady=10)
@@ -670,20 +989,20 @@ class DocumentProcessorApp:
             ocr_info = tk.Label(
                 ocr_frame,
                 text="To enable OCR: pip install pytesseract pdf2image\nAlso install Tesseract-OCR from GitHub",
-                font=("Arial", 9),
+                font=self.font_label,
                 fg="gray"
             )
             ocr_info.pack(pady=5)
         
         # Logging Settings
-        log_frame = tk.LabelFrame(frame, text="Logging", font=("Arial", 10, "bold"))
+        log_frame = tk.LabelFrame(frame, text="Logging", font=self.font_button)
         log_frame.pack(fill='x', padx=20, pady=10)
         
-        log_dir = Path.home() / "Documents" / "DocumentProcessorLogs"
+        log_dir = self.log_dir
         log_info = tk.Label(
             log_frame,
             text=f"Log files saved to:\n{log_dir}",
-            font=("Arial", 9),
+            font=self.font_label,
             fg="darkblue"
         )
         log_info.pack(pady=10)
@@ -695,12 +1014,12 @@ class DocumentProcessorApp:
             command=self.clear_log_files,
             bg="#ff9800",
             fg="white",
-            font=("Arial", 9)
+            font=self.font_label
         )
         clear_logs_btn.pack(pady=5)
         
         # About
-        about_frame = tk.LabelFrame(frame, text="About", font=("Arial", 10, "bold"))
+        about_frame = tk.LabelFrame(frame, text="About", font=self.font_button)
         about_frame.pack(fill='x', padx=20, pady=10)
         
         about_text = (
@@ -719,7 +1038,7 @@ class DocumentProcessorApp:
             about_frame,
             text=about_text,
             justify="left",
-            font=("Arial", 9),
+            font=self.font_label,
             fg="darkblue",
             wraplength=750
         )
@@ -740,7 +1059,7 @@ class DocumentProcessorApp:
         log_title = tk.Label(
             log_header,
             text="📋 Processing Log",
-            font=("Segoe UI", 11, "bold"),
+            font=self.font_subtitle_bold,
             fg=self.colors['text_primary'],
             bg=self.colors['card']
         )
@@ -765,7 +1084,7 @@ class DocumentProcessorApp:
             controls_frame,
             text="Auto-scroll",
             variable=self.auto_scroll_var,
-            font=("Segoe UI", 9),
+            font=self.font_small,
             fg=self.colors['text_secondary'],
             bg=self.colors['card'],
             activebackground=self.colors['card']
@@ -776,26 +1095,19 @@ class DocumentProcessorApp:
         log_content = tk.Frame(log_container, bg=self.colors['card'], relief='solid', bd=1)
         log_content.pack(fill='x')
         
-        # Create modern scrolled text widget
-        self.log_text = scrolledtext.ScrolledText(
+        # Virtualized viewer: bounded line buffer, draws only the
+        # visible viewport regardless of how much has been logged
+        log_scrollbar = ttk.Scrollbar(log_content, orient='vertical')
+        self.log_text = VirtualLogView(
             log_content,
-            height=10,
-            font=("Cascadia Code", 9),  # Modern monospace font
-            wrap=tk.WORD,
-            bg='#1E1E1E',  # Dark background for logs
+            font=self.font_mono,  # Modern monospace font
             fg='#D4D4D4',  # Light text
-            insertbackground='#D4D4D4',
-            selectbackground='#264F78',
-            relief='flat',
-            bd=0
+            bg='#1E1E1E',  # Dark background for logs
+            height=self.font_mono.metrics('linespace') * 10
         )
-        self.log_text.pack(fill='both', expand=True, padx=1, pady=1)
-        
-        # Configure text tags for colored log output
-        self.log_text.tag_config('error', foreground='#F48771')    # Light red
-        self.log_text.tag_config('warning', foreground='#DCDCAA')  # Yellow
-        self.log_text.tag_config('success', foreground='#4EC9B0')  # Green
-        self.log_text.tag_config('info', foreground='#9CDCFE')     # Light blue
+        log_scrollbar.pack(side='right', fill='y')
+        self.log_text.pack(side='left', fill='both', expand=True, padx=1, pady=1)
+        self.log_text.attach_scrollbar(log_scrollbar)
     
     def browse_folder(self, var):
         """Browse for folder"""
@@ -819,31 +1131,44 @@ class DocumentProcessorApp:
             self.vendor_file_var.set(file_path)
     
     def load_vendor_list(self, file_path):
-        """Load vendor master list from file"""
+        """Load vendor master list from file
+
+        Parsed csv/xlsx lists are cached as pickles keyed on the
+        file's path, mtime and size, so repeat runs against an
+        unchanged master list skip the pandas parse entirely (Excel
+        parsing dominates warm-start time on big lists).
+        """
         if not file_path or not os.path.exists(file_path):
             return None
-        
+
+        ext = os.path.splitext(file_path)[1].lower()
+        loader = _VENDOR_LOADERS.get(ext)
+        if loader is None:
+            return None
+
         try:
-            if file_path.endswith('.txt'):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return [line.strip() for line in f if line.strip()]
-            elif file_path.endswith('.csv'):
-                import pandas as pd
-                df = pd.read_csv(file_path)
-                # Try to find vendor column
-                for col in ['vendor', 'vendors', 'company', 'name']:
-                    if col in df.columns:
-                        return df[col].dropna().tolist()
-                return df.iloc[:, 0].dropna().tolist()  # Use first column
-            elif file_path.endswith('.xlsx'):
-                import pandas as pd
-                df = pd.read_excel(file_path)
-                for col in ['vendor', 'vendors', 'company', 'name']:
-                    if col in df.columns:
-                        return df[col].dropna().tolist()
-                return df.iloc[:, 0].dropna().tolist()
+            cache_file = None
+            if ext in _CACHED_VENDOR_EXTS:
+                stat = os.stat(file_path)
+                key = f"{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+                digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+                cache_file = self.log_dir / 'vendor_cache' / f'vendor_{digest}.pkl'
+                if cache_file.exists():
+                    with open(cache_file, 'rb') as f:
+                        return pickle.load(f)
+
+            vendors = loader(file_path)
+
+            if cache_file is not None:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'wb') as f:
+                    pickle.dump(vendors, f, protocol=pickle.HIGHEST_PROTOCOL)
+            return vendors
         except Exception as e:
-            messagebox.showerror("Error", f"Could not load vendor list: {e}")
+            # Called from the processing worker thread, so the dialog
+            # must be marshaled onto the mainloop
+            self._show_dialog_on_main_thread(
+                'error', "Error", f"Could not load vendor list: {e}")
             return None
     
     def start_contract_processing(self):
@@ -885,49 +1210,83 @@ class DocumentProcessorApp:
         
         if result:
             self.clear_log()
-            self.log_text.insert(tk.END, f"Starting {mode_desc.lower()} contract processing...\n")
-            
-            # Start processing in separate thread
-            thread = threading.Thread(
-                target=self.run_contract_processing,
-                args=(input_folder, error_folder),
-                daemon=True
-            )
-            thread.start()
+            self.log_writer.write(f"Starting {mode_desc.lower()} contract processing...\n")
+
+            # Queue onto the persistent worker; a second click while a
+            # run is active simply waits its turn
+            self._jobs.put((self.run_contract_processing,
+                            (input_folder, error_folder)))
     
+    def _worker_loop(self):
+        """Run queued background jobs one at a time
+
+        The run_* targets handle their own errors; this guard only
+        covers failures outside them so the worker never dies.
+        """
+        while True:
+            func, args = self._jobs.get()
+            try:
+                func(*args)
+            except Exception as e:
+                self._show_dialog_on_main_thread(
+                    'error', "Error", f"Background task failed: {e}")
+            finally:
+                self._jobs.task_done()
+
+    def _show_dialog_on_main_thread(self, kind, title, message):
+        """Schedule a messagebox on the Tk thread
+
+        The processing runners execute on worker threads; Tk (including
+        messagebox) must only be touched from the mainloop thread.
+        """
+        show = {'info': messagebox.showinfo,
+                'error': messagebox.showerror}[kind]
+        self.root.after(0, lambda: show(title, message))
+
     def run_contract_processing(self, input_folder, error_folder):
-        """Run contract processing"""
+        """Run contract processing
+
+        Runs on a coordinator thread so the GUI stays live; the
+        CPU-bound work (text extraction, classification) already fans
+        out across a process pool inside process_contracts_enhanced, so
+        the GIL never serializes the per-document parsing. Console
+        output is redirected into the log widget only for the duration
+        of the run.
+        """
         try:
-            # Load vendor list if provided
-            vendor_list = None
-            vendor_file = self.vendor_file_var.get().strip()
-            if vendor_file:
-                vendor_list = self.load_vendor_list(vendor_file)
-                if vendor_list:
-                    print(f"Loaded {len(vendor_list)} vendors from master list")
-            
-            # Choose processing mode
-            if self.processing_mode.get() == 'enhanced':
-                processor = DocumentProcessor(input_folder, error_folder, vendor_list)
-                processor.process_contracts_enhanced(
-                    create_subfolders=self.create_subfolders_var.get(),
-                    naming_format='enhanced'
-                )
-            else:
-                processor = DocumentProcessor(input_folder, error_folder, vendor_list)
-                processor.process_contracts_enhanced(
-                    create_subfolders=False,
-                    naming_format='simple'
-                )
-            
-            processor.print_summary()
-            print("\n✅ Contract processing completed!")
-            
-            messagebox.showinfo("Complete", "Contract processing completed! Check the log for details.")
-            
+            with redirect_stdout(self.log_writer), redirect_stderr(self.log_writer):
+                # Load vendor list if provided
+                vendor_list = None
+                vendor_file = self.vendor_file_var.get().strip()
+                if vendor_file:
+                    vendor_list = self.load_vendor_list(vendor_file)
+                    if vendor_list:
+                        print(f"Loaded {len(vendor_list)} vendors from master list")
+
+                # Choose processing mode
+                if self.processing_mode.get() == 'enhanced':
+                    processor = DocumentProcessor(input_folder, error_folder, vendor_list)
+                    processor.process_contracts_enhanced(
+                        create_subfolders=self.create_subfolders_var.get(),
+                        naming_format='enhanced'
+                    )
+                else:
+                    processor = DocumentProcessor(input_folder, error_folder, vendor_list)
+                    processor.process_contracts_enhanced(
+                        create_subfolders=False,
+                        naming_format='simple'
+                    )
+
+                processor.print_summary()
+                print("\n✅ Contract processing completed!")
+
+            self._show_dialog_on_main_thread(
+                'info', "Complete",
+                "Contract processing completed! Check the log for details.")
+
         except Exception as e:
-            print(f"\n❌ Error during processing: {e}")
-            messagebox.showerror("Error", f"Processing failed: {e}")
+            self.log_writer.write(f"\n❌ Error during processing: {e}\n")
+            self._show_dialog_on_main_thread('error', "Error", f"Processing failed: {e}")
     
     def start_file_sorting(self):
         """Start file sorting in separate thread"""
@@ -974,44 +1333,48 @@ class DocumentProcessorApp:
         
         if result:
             self.clear_log()
-            self.log_text.insert(tk.END, f"Starting file sorting (pre-{year_threshold} removal)...\n")
-            
-            # Start sorting in separate thread
-            thread = threading.Thread(
-                target=self.run_file_sorting,
-                args=(source_dir, archive_dir, error_dir, year_threshold),
-                daemon=True
-            )
-            thread.start()
+            self.log_writer.write(f"Starting file sorting (pre-{year_threshold} removal)...\n")
+
+            self._jobs.put((self.run_file_sorting,
+                            (source_dir, archive_dir, error_dir, year_threshold)))
     
     def run_file_sorting(self, source_dir, archive_dir, error_dir, year_threshold):
-        """Run file sorting"""
+        """Run file sorting with console output scoped to the log widget"""
         try:
-            processor = DocumentProcessor(source_dir, error_dir)
-            processor.sort_files_by_year(archive_dir, year_threshold)
-            processor.print_summary()
-            print(f"\n✅ File sorting completed!")
-            
-            messagebox.showinfo("Complete", "File sorting completed! Check the log for details.")
-            
+            with redirect_stdout(self.log_writer), redirect_stderr(self.log_writer):
+                processor = DocumentProcessor(source_dir, error_dir)
+                processor.sort_files_by_year(archive_dir, year_threshold)
+                processor.print_summary()
+                print(f"\n✅ File sorting completed!")
+
+            self._show_dialog_on_main_thread(
+                'info', "Complete",
+                "File sorting completed! Check the log for details.")
+
         except Exception as e:
-            print(f"\n❌ Error during sorting: {e}")
-            messagebox.showerror("Error", f"Sorting failed: {e}")
+            self.log_writer.write(f"\n❌ Error during sorting: {e}\n")
+            self._show_dialog_on_main_thread('error', "Error", f"Sorting failed: {e}")
     
     def clear_log(self):
         """Clear the log display"""
-        self.log_text.delete(1.0, tk.END)
+        self.log_text.clear()
     
     def clear_log_files(self):
         """Clear log files from disk"""
         try:
-            log_dir = Path.home() / "Documents" / "DocumentProcessorLogs"
-            if log_dir.exists():
-                for log_file in log_dir.glob("*.log"):
-                    log_file.unlink()
-                for log_file in log_dir.glob("*.txt"):
-                    log_file.unlink()
-                messagebox.showinfo("Success", "Log files cleared")
+            if not self.log_dir.exists():
+                messagebox.showinfo("Info", "No log files found")
+                return
+            # One directory scan instead of two glob passes, each of
+            # which re-stats every entry for pattern matching
+            removed = 0
+            with os.scandir(self.log_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(('.log', '.txt')) and entry.is_file():
+                        os.unlink(entry.path)
+                        removed += 1
+            if removed:
+                messagebox.showinfo("Success", f"Cleared {removed} log file(s)")
             else:
                 messagebox.showinfo("Info", "No log files found")
         except Exception as e:
@@ -1019,13 +1382,19 @@ class DocumentProcessorApp:
     
     def on_closing(self):
         """Handle application closing"""
-        # Restore stdout/stderr
-        sys.stdout = self.original_stdout
-        sys.stderr = self.original_stderr
-        
-        # Save configuration
-        self.save_config()
-        
+        # Write the final configuration synchronously - a background
+        # writer could be killed with the process before finishing
+        self._config_dirty = False
+        self._write_config(dict(self.config))
+
+        # Flush the buffered tail of the session log to disk
+        if self._session_log is not None:
+            try:
+                self.log_writer.flush()
+                self._session_log.close()
+            except OSError:
+                pass
+
         # Close application
         self.root.destroy()
 